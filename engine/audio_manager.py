@@ -5,6 +5,9 @@ import os
 from typing import Optional
 from engine.base_manager import BaseManager
 
+# Audio file extensions supported by the loader
+SUPPORTED_AUDIO_FORMATS = frozenset({".wav", ".mp3"})
+
 
 class AudioManager(BaseManager):
     """
@@ -26,6 +29,7 @@ class AudioManager(BaseManager):
             - sfx_volume (float): Sound effects volume level (0.0 to 1.0).
             - voice_volume (float): Voice clips volume level (0.0 to 1.0).
             - mute (bool): Indicates if audio is currently muted.
+            - volume_setters (dict): Volume setter methods keyed by volume type.
 
         Playback Attributes:
             - music_paused (bool): Indicates if the background music is currently paused.
@@ -100,6 +104,12 @@ class AudioManager(BaseManager):
         self.volume_sfx = Optional[float]
         self.volume_voice = Optional[float]
         self.mute = Optional[bool]
+        self.volume_setters = {
+            "master": self.set_master_volume,
+            "bgm": self.set_bgm_volume,
+            "sfx": self.set_sfx_volume,
+            "voice": self.set_voice_volume
+        }
 
         # Playback Attributes
         self.music_paused = Optional[bool]
@@ -141,10 +151,6 @@ class AudioManager(BaseManager):
         """
         audio_library = {}
 
-        def is_valid_file(audio_filename, extensions):
-            """Check if the filename ends with valid extensions."""
-            return any(audio_filename.lower().endswith(ext) for ext in extensions)
-
         # Determine the category based on the folder name
         if "bgm" in folder_path.lower():
             category = "music"
@@ -155,26 +161,29 @@ class AudioManager(BaseManager):
 
         # Check if the folder path exists
         if os.path.exists(folder_path):
-            # Iterate over files in the folder
-            for filename in os.listdir(folder_path):
-                file_path = os.path.join(folder_path, filename)
-                base_filename = os.path.splitext(filename)[0]
-                try:
-                    if category == "music" and is_valid_file(filename, (".wav", ".mp3")):
-                        # Load as music
-                        audio_library[base_filename] = file_path
-                        self.log_debug(f"Loaded background music: {filename}")
-                    elif category in "sound" and is_valid_file(filename, (".wav", ".mp3")):
-                        # Load as sound
-                        sound = pygame.mixer.Sound(file_path)
-                        audio_library[base_filename] = sound
-                        self.log_debug(f"Loaded {category} file: {filename}")
-                    else:
-                        # Log a warning for unsupported file extensions
-                        self.log_warning(f"Ignoring file {filename} with unsupported extension in {folder_path}")
-
-                except pygame.error as e:
-                    self.log_error(f"Error loading audio file {filename}: {e}")
+            # Iterate over files in the folder with a single directory scan
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    file_path = entry.path
+                    base_filename, extension = os.path.splitext(filename)
+                    is_valid_file = entry.is_file() and extension.lower() in SUPPORTED_AUDIO_FORMATS
+                    try:
+                        if category == "music" and is_valid_file:
+                            # Load as music
+                            audio_library[base_filename] = file_path
+                            self.log_debug(f"Loaded background music: {filename}")
+                        elif category in "sound" and is_valid_file:
+                            # Load as sound
+                            sound = pygame.mixer.Sound(file_path)
+                            audio_library[base_filename] = sound
+                            self.log_debug(f"Loaded {category} file: {filename}")
+                        else:
+                            # Log a warning for unsupported file extensions
+                            self.log_warning(f"Ignoring file {filename} with unsupported extension in {folder_path}")
+
+                    except pygame.error as e:
+                        self.log_error(f"Error loading audio file {filename}: {e}")
 
         # Log the number of files loaded
         num_files_loaded = len(audio_library)
@@ -516,12 +525,10 @@ class AudioManager(BaseManager):
             volume_type (str): Type of volume to adjust ("master", "bgm", "sfx", "voice").
             step (float): Step to increment or decrement the volume level.
         """
-        # Valid volume types
-        valid_volume_types = ["master", "bgm", "sfx", "voice"]
-
         # Check if the provided volume type is valid
-        if volume_type not in valid_volume_types:
-            self.log_warning(f"Invalid volume type: {volume_type}. Must be one of {valid_volume_types}.")
+        set_volume = self.volume_setters.get(volume_type)
+        if set_volume is None:
+            self.log_warning(f"Invalid volume type: {volume_type}. Must be one of {list(self.volume_setters)}.")
             return
 
         # Get current volume level
@@ -531,7 +538,7 @@ class AudioManager(BaseManager):
         new_volume = min(1.0, max(0.0, current_volume + step))
 
         # Set the new volume level
-        getattr(self, f'set_{volume_type}_volume')(new_volume)
+        set_volume(new_volume)
 
     def increment_volume(self, volume_type, step):
         """
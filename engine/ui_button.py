@@ -32,8 +32,7 @@ class UIButton(UIElement):
             - click(): Triggers the action associated with clicking the button.
 
         Game Loop:
-            - update(mouse_pos, mouse_clicks): Updates the UIButton's state.
-            - draw(surface): Draws the UIButton on the provided surface.
+            - update(mouse_pos, mouse_clicks, mouse_pressed): Updates the UIButton's state.
     """
     def __init__(self, element_id, config, managers, logger):
         """
@@ -144,25 +143,16 @@ class UIButton(UIElement):
     """
     Game Loop
         - update
-        - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, mouse_pos, mouse_clicks, mouse_pressed):
         """
         Update the UIButton state.
 
         Args:
             mouse_pos (tuple): Current position of the mouse.
             mouse_clicks (list): List of mouse click states.
+            mouse_pressed (tuple): Mouse buttons held down during the current frame.
         """
-        super().update(mouse_pos, mouse_clicks)
+        super().update(mouse_pos, mouse_clicks, mouse_pressed)
         if self.hovered_state and mouse_clicks[1]:
             self.click()
-
-    def draw(self, surface):
-        """
-        Draw the UIButton on the given surface.
-
-        Args:
-            surface (pygame.Surface): The surface to draw the UIButton on.
-        """
-        super().draw(surface)
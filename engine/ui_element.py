@@ -1,6 +1,7 @@
 # ui_element.py
 
 import pygame
+from collections import OrderedDict
 from utils import setup_managers
 
 DEFAULT_CONFIG = {
@@ -31,6 +32,117 @@ DEFAULT_CONFIG = {
     'drag_exclusive': True
 }
 
+# Rect attributes used to anchor a position for each alignment value
+ALIGN_ATTRIBUTES = {
+    'center': 'center',
+    'nw': 'topleft',
+    'n': 'midtop',
+    'ne': 'topright',
+    'e': 'midright',
+    'se': 'bottomright',
+    's': 'midbottom',
+    'sw': 'bottomleft',
+    'w': 'midleft'
+}
+
+# Pre-rendered surfaces shared between elements with identical styles
+SURFACE_CACHE = {}
+
+# Loaded images shared between elements, keyed by file path and scaled size
+IMAGE_CACHE = {}
+
+# Loaded fonts shared between elements, keyed by font name and size
+FONT_CACHE = {}
+
+# Rendered text surfaces shared between elements, keyed by font, text and color
+# Bounded in least-recently-used order, since labels with changing text would otherwise grow it forever
+TEXT_CACHE = OrderedDict()
+TEXT_CACHE_SIZE = 256
+
+
+def load_image(image_path, size=None):
+    """
+    Load an image converted to the display format, reusing it if it was already loaded.
+
+    Args:
+        image_path (str): Path to the image file.
+        size (tuple or None): Size (width, height) to pre-scale the image to (default: original size).
+
+    Returns:
+        pygame.Surface: The loaded image surface.
+    """
+    cache_key = (image_path, size)
+    image = IMAGE_CACHE.get(cache_key)
+    if image is None:
+        if size:
+            # Scale once from the original image and keep the result for later elements
+            image = pygame.transform.scale(load_image(image_path), size)
+        else:
+            # Keep per-pixel alpha only for images that use it, opaque images blit faster without it
+            image = pygame.image.load(image_path)
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        IMAGE_CACHE[cache_key] = image
+    return image
+
+
+def load_font(font_name, font_size):
+    """
+    Load a font, sharing a single instance per (font_name, font_size) pair.
+
+    Args:
+        font_name (str or None): Path to the font file, or None for the default font.
+        font_size (int): Size of the font.
+
+    Returns:
+        pygame.font.Font: The loaded font.
+    """
+    cache_key = (font_name, font_size)
+    font = FONT_CACHE.get(cache_key)
+    if font is None:
+        font = pygame.font.Font(font_name, font_size)
+        FONT_CACHE[cache_key] = font
+    return font
+
+
+def render_text(font_name, font_size, text, color):
+    """
+    Render a text surface, reusing it if the same text was already rendered.
+
+    Args:
+        font_name (str or None): Path to the font file, or None for the default font.
+        font_size (int): Size of the font.
+        text (str): Text to render.
+        color (tuple): Color of the text.
+
+    Returns:
+        pygame.Surface: The rendered text surface.
+    """
+    cache_key = (font_name, font_size, text, tuple(color))
+    text_surface = TEXT_CACHE.get(cache_key)
+    if text_surface is None:
+        text_surface = load_font(font_name, font_size).render(text, True, color)
+        TEXT_CACHE[cache_key] = text_surface
+
+        # Evict the least recently used text surface once the cache is full
+        if len(TEXT_CACHE) > TEXT_CACHE_SIZE:
+            TEXT_CACHE.popitem(last=False)
+    else:
+        TEXT_CACHE.move_to_end(cache_key)
+    return text_surface
+
+
+def clear_caches():
+    """
+    Release all cached surfaces, images, fonts and text, e.g. before pygame.font.quit() or loading a different set of assets.
+    """
+    SURFACE_CACHE.clear()
+    IMAGE_CACHE.clear()
+    FONT_CACHE.clear()
+    TEXT_CACHE.clear()
+
 
 class UIElement:
     def __init__(self, element_type, element_id, config, managers, logger):
@@ -58,6 +170,7 @@ class UIElement:
         self.pos_x = self.config.get('pos_x')
         self.pos_y = self.config.get('pos_y')
         self.align = self.config.get('align')
+        self.aligned_pos = None
 
         # Rectangle Attributes
         self.rectangle_enabled = self.config.get('rectangle_enabled')
@@ -65,6 +178,8 @@ class UIElement:
         self.rectangle_height = self.config.get('rectangle_height')
         self.rectangle_color = self.config.get('rectangle_color')
         self.rectangle_surface = None
+        self.rectangle_idle_surface = None
+        self.rectangle_hover_surface = None
         self.rectangle_rect = None
 
         # Image Attributes
@@ -115,6 +230,10 @@ class UIElement:
         self.collision_rect = None
         self.collision_surface = None
 
+        # Bounding Attributes
+        self.bounding_rect = None
+        self.draw_rect = None
+
         # Hover Attributes
         self.hover_color = self.config.get('hover_color')
         self.hovered_state = False
@@ -133,23 +252,47 @@ class UIElement:
         self.drag_offset = None
         self.original_pos = None
 
+        # Validate the alignments once so that aligning rects needs no further checks
+        self.validate_alignments()
+
         # Initialize graphical components
         self.setup_graphics()
 
     """
     Helper Methods
     - create_surface_rect
+    - render_surface
     - align_rect
+    - validate_alignments
     """
     def create_surface_rect(self, width, height,
                             position=None, align=None,
                             color=None, alpha=None,
                             shape=None, border_thickness=None):
+        # Reuse the surface of an element with the same style if one was already rendered
+        cache_key = (width, height, tuple(color) if color else None, alpha, shape, border_thickness)
+        surface = SURFACE_CACHE.get(cache_key)
+        if surface is None:
+            surface = self.render_surface(width, height, color, alpha, shape, border_thickness)
+            SURFACE_CACHE[cache_key] = surface
+
+        # Create a rect from the surface
+        rect = surface.get_rect()
+
+        # Set alignment and position (default if not provided)
+        align = align or self.align
+        position = position or (self.pos_x, self.pos_y)
+        self.align_rect(rect, align, position)
+
+        return surface, rect
+
+    def render_surface(self, width, height, color, alpha, shape, border_thickness):
+        """
+        Render a surface filled or drawn with the given color and shape.
+        """
         # Create the surface with or without alpha channel
         surface_flags = pygame.SRCALPHA if alpha is not None else 0
         surface = pygame.Surface((width, height), surface_flags)
-
-        # Create a rect from the surface
         rect = surface.get_rect()
 
         # Handle color and shape drawing operations
@@ -170,38 +313,31 @@ class UIElement:
         if alpha:
             surface.set_alpha(alpha)
 
-        # Set alignment and position (default if not provided)
-        align = align or self.align
-        position = position or (self.pos_x, self.pos_y)
-        self.align_rect(rect, align, position)
-
-        return surface, rect
+        return surface
 
     def align_rect(self, rect, align, position):
         """
         Align the rectangle based on the provided alignment and position.
+
+        Element alignments are checked once by validate_alignments; other values are still checked here.
         """
-        if align == 'center':
-            rect.center = position
-        elif align == 'nw':
-            rect.topleft = position
-        elif align == 'n':
-            rect.midtop = position
-        elif align == 'ne':
-            rect.topright = position
-        elif align == 'e':
-            rect.midright = position
-        elif align == 'se':
-            rect.bottomright = position
-        elif align == 's':
-            rect.midbottom = position
-        elif align == 'sw':
-            rect.bottomleft = position
-        elif align == 'w':
-            rect.midleft = position
+        align_attribute = ALIGN_ATTRIBUTES.get(align)
+        if align_attribute:
+            setattr(rect, align_attribute, position)
         else:
             self.logger.log_warning(f"Unsupported alignment value '{align}' provided.")
 
+    def validate_alignments(self):
+        """
+        Validate the alignment values of the element, falling back to 'center' for unsupported ones.
+        """
+        if self.align not in ALIGN_ATTRIBUTES:
+            self.logger.log_warning(f"Unsupported alignment value '{self.align}' provided.")
+            self.align = 'center'
+        if self.text_align not in ALIGN_ATTRIBUTES:
+            self.logger.log_warning(f"Unsupported text alignment value '{self.text_align}' provided.")
+            self.text_align = 'center'
+
     """
     Setup Methods
     - setup_graphics
@@ -226,13 +362,14 @@ class UIElement:
         if not self.image_enabled or not self.image_path:
             return
 
-        # Load the image surface with alpha transparency
-        self.image = pygame.image.load(self.image_path).convert_alpha()
-        self.image_surface = self.image.copy()
+        # Load the image surface in the display format
+        # The loaded image is only used as a blit source, so it is shared rather than copied
+        self.image = load_image(self.image_path)
+        self.image_surface = self.image
 
         # Check if specific dimensions for the image are provided
         if self.image_width and self.image_height:
-            self.image_surface = pygame.transform.scale(self.image_surface, (self.image_width, self.image_height))
+            self.image_surface = load_image(self.image_path, (self.image_width, self.image_height))
         else:
             self.image_width, self.image_height = self.image_surface.get_size()
 
@@ -256,6 +393,16 @@ class UIElement:
             color=self.rectangle_color, alpha=False,
             shape=None, border_thickness=None
         )
+        self.rectangle_idle_surface = self.rectangle_surface
+
+        # Pre-render the hovered rectangle surface so hovering only swaps surfaces
+        if self.hover_color:
+            self.rectangle_hover_surface, _ = self.create_surface_rect(
+                self.rectangle_width, self.rectangle_height,
+                position=(self.pos_x, self.pos_y), align=self.align,
+                color=self.hover_color, alpha=False,
+                shape=None, border_thickness=None
+            )
 
     def setup_shadow(self):
         """
@@ -310,10 +457,10 @@ class UIElement:
             return
 
         # Initialize the text_font
-        self.text_font = pygame.font.Font(self.text_font_name, self.text_font_size)
+        self.text_font = load_font(self.text_font_name, self.text_font_size)
 
         # Create the text surface and rect
-        self.text_surface = self.text_font.render(self.text_label, True, self.text_color)
+        self.text_surface = render_text(self.text_font_name, self.text_font_size, self.text_label, self.text_color)
         self.text_rect = self.text_surface.get_rect()
 
         # Align the text rect
@@ -323,6 +470,7 @@ class UIElement:
     Update Methods
     - update_graphics
         - update_rect
+        - update_bounds
         - update_outline
     - update_events
         - update_click
@@ -331,11 +479,18 @@ class UIElement:
         - update_drag
     """
     def update_graphics(self):
+        # Only realign the rects when the element has moved since the last update
+        position = (self.pos_x, self.pos_y)
+        if position == self.aligned_pos:
+            return
+        self.aligned_pos = position
+
         self.update_rect()
+        self.update_bounds()
         self.update_outline()
 
-    def update_events(self, mouse_pos):
-        self.update_drag(mouse_pos)
+    def update_events(self, mouse_pos, mouse_pressed):
+        self.update_drag(mouse_pos, mouse_pressed)
         self.update_hover(mouse_pos)
 
     def update_rect(self):
@@ -355,6 +510,25 @@ class UIElement:
         if self.collision_rect:
             self.align_rect(self.collision_rect, self.align, (self.pos_x, self.pos_y))
 
+    def update_bounds(self):
+        """
+        Update the bounding rect that contains all the defined rects, and the draw rect that also covers the collision rect.
+        """
+        # Initialize a list for all defined rectangles, removing None values
+        rects = [r for r in (self.rectangle_rect, self.image_rect, self.shadow_rect, self.text_rect) if r]
+
+        # Calculate the bounding box that contains all the rects
+        if rects:
+            self.bounding_rect = rects[0].unionall(rects[1:])
+        else:
+            self.bounding_rect = self.collision_rect
+
+        # The collision surface is drawn too and may extend beyond the visual layers
+        if self.bounding_rect and self.collision_rect:
+            self.draw_rect = self.bounding_rect.union(self.collision_rect)
+        else:
+            self.draw_rect = self.bounding_rect
+
     def update_outline(self):
         """
         Update the outline surface and rect.
@@ -362,24 +536,11 @@ class UIElement:
         if not self.outline_enabled:
             return
 
-        # Initialize a list for all defined rectangles
-        rects = [self.rectangle_rect, self.image_rect, self.shadow_rect, self.text_rect]
-
-        # Remove None values from the list
-        rects = [r for r in rects if r]
-
-        # Calculate the bounding box that contains all the rects
-        min_x = min(r.x for r in rects)
-        min_y = min(r.y for r in rects)
-        max_x = max(r.right for r in rects)
-        max_y = max(r.bottom for r in rects)
-        width = max_x - min_x
-        height = max_y - min_y
-
         # Create a new outline rect if the bounding box has changed
-        if pygame.Rect(min_x, min_y, width, height) != self.outline_rect:
+        if self.bounding_rect and self.bounding_rect != self.outline_rect:
             # Update the outline position
-            self.outline_pos_x, self.outline_pos_y = (min_x, min_y)
+            self.outline_pos_x, self.outline_pos_y = self.bounding_rect.topleft
+            width, height = self.bounding_rect.size
 
             # Create the outline surface and rect
             self.outline_surface = pygame.Surface((width, height), pygame.SRCALPHA)
@@ -405,27 +566,35 @@ class UIElement:
             mouse_pos (tuple): The (x, y) position of the mouse cursor.
         """
         # Determine if the mouse is hovering over the collision rect
-        self.hovered_state = self.collision_rect.collidepoint(mouse_pos)
-        if self.rectangle_surface and self.hover_color:
-            # Change the rect color based on the hover state
-            self.rectangle_surface.fill(self.hover_color if self.hovered_state else self.rectangle_color)
+        hovered_state = bool(self.collision_rect.collidepoint(mouse_pos))
 
-    def update_drag(self, mouse_pos):
+        # Only swap surfaces when the hover state changes
+        if hovered_state == self.hovered_state:
+            return
+        self.hovered_state = hovered_state
+
+        if self.rectangle_hover_surface:
+            # Swap between the pre-rendered rect surfaces based on the hover state
+            if self.hovered_state:
+                self.rectangle_surface = self.rectangle_hover_surface
+            else:
+                self.rectangle_surface = self.rectangle_idle_surface
+
+    def update_drag(self, mouse_pos, mouse_pressed):
         """
         Update the drag logic.
 
         Args:
             mouse_pos (tuple): The (x, y) position of the mouse cursor.
+            mouse_pressed (tuple): Mouse buttons held down during the current frame.
         """
         if not self.drag_enabled:
             return
 
-        mouse_buttons = pygame.mouse.get_pressed()
-
         # Left mouse button is pressed
-        if mouse_buttons[0]:
+        if mouse_pressed[0]:
             if self.dragging:
-                if mouse_buttons[2]:
+                if mouse_pressed[2]:
                     # Right mouse button cancels dragging
                     self.dragging = False
                     self.pos_x, self.pos_y = self.original_pos
@@ -467,28 +636,45 @@ class UIElement:
     """
     Game Loop
     - update
+    - get_blit_sequence
     - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, mouse_pos, mouse_clicks, mouse_pressed):
         if not self.state_active:
             return
 
         self.update_graphics()
-        self.update_events(mouse_pos)
+        self.update_events(mouse_pos, mouse_pressed)
 
-    def draw(self, surface):
+    def get_blit_sequence(self):
+        """
+        Get the (surface, rect) pairs to blit for this element, in drawing order.
+
+        This is the drawing override point for subclasses: UIManager batches these sequences
+        across elements and does not call draw().
+
+        Returns:
+            list: List of (pygame.Surface, pygame.Rect) tuples.
+        """
         if not self.state_visible:
-            return
+            return []
+
+        layers = (
+            (self.shadow_surface, self.shadow_rect),
+            (self.rectangle_surface, self.rectangle_rect),
+            (self.image_surface, self.image_rect),
+            (self.text_surface, self.text_rect),
+            (self.outline_surface, self.outline_rect),
+            (self.collision_surface, self.collision_rect)
+        )
+        return [layer for layer in layers if layer[0]]
 
-        if self.shadow_surface:
-            surface.blit(self.shadow_surface, self.shadow_rect)
-        if self.rectangle_surface:
-            surface.blit(self.rectangle_surface, self.rectangle_rect)
-        if self.image_surface:
-            surface.blit(self.image_surface, self.image_rect)
-        if self.text_surface:
-            surface.blit(self.text_surface, self.text_rect)
-        if self.outline_surface:
-            surface.blit(self.outline_surface, self.outline_rect)
-        if self.collision_surface:
-            surface.blit(self.collision_surface, self.collision_rect)
+    def draw(self, surface):
+        """
+        Draw the element on its own, outside of the UIManager batch.
+
+        Args:
+            surface (pygame.Surface): The surface to draw the element on.
+        """
+        # Blit all the layers of the element in a single call
+        surface.blits(self.get_blit_sequence(), doreturn=False)
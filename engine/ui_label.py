@@ -23,8 +23,7 @@ class UILabel(UIElement):
 
     Methods:
         Game Loop:
-            - update(mouse_pos, mouse_clicks): Update the UILabel state.
-            - draw(surface): Draw the UILabel on the given surface.
+            - update(mouse_pos, mouse_clicks, mouse_pressed): Update the UILabel state.
     """
     def __init__(self, element_id, config, managers, logger):
         """
@@ -44,23 +43,14 @@ class UILabel(UIElement):
     """
     Game Loop
         - update
-        - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, mouse_pos, mouse_clicks, mouse_pressed):
         """
         Update the UILabel state.
 
         Args:
             mouse_pos (tuple): Current position of the mouse.
             mouse_clicks (list): List of mouse click states.
+            mouse_pressed (tuple): Mouse buttons held down during the current frame.
         """
-        super().update(mouse_pos, mouse_clicks)
-
-    def draw(self, surface):
-        """
-        Draw the UILabel on the given surface.
-
-        Args:
-            surface (pygame.Surface): The surface to draw the UILabel on.
-        """
-        super().draw(surface)
+        super().update(mouse_pos, mouse_clicks, mouse_pressed)
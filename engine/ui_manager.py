@@ -1,6 +1,7 @@
 # ui_manager.py
 
 import pygame
+from collections import Counter
 from typing import Optional
 
 from menu_config import menu_config
@@ -32,9 +33,15 @@ class UIManager(BaseManager):
             - load_menu(menu_name): Load a menu from configuration.
 
         Game Loop:
-            - update(mouse_pos, mouse_clicks): Update the UI state based on mouse interactions.
+            - update(mouse_pos, mouse_clicks, mouse_pressed): Update the UI state based on mouse interactions.
             - draw(): Render the UI elements on the display surface.
     """
+    # UIElement subclasses keyed by the element type used in the menu configuration
+    ELEMENT_CLASSES = {
+        'button': UIButton,
+        'label': UILabel
+    }
+
     def __init__(self):
         """
         Initialize the UIManager instance.
@@ -91,13 +98,19 @@ class UIManager(BaseManager):
             self.current_menu = menu_name
             self.ui_elements = {}
 
+            # Element IDs share a single namespace across element types, so report duplicates once up front
+            element_ids = Counter(element_id for elements in menu_config[menu_name].values() for element_id in elements)
+            duplicate_ids = [element_id for element_id, count in element_ids.items() if count > 1]
+            if duplicate_ids:
+                self.log_warning(f"Duplicate element IDs in menu '{menu_name}' will override each other: {duplicate_ids}")
+
             # Iterate over the elements in the menu configuration and initialize UIElements
             for element_type, elements in menu_config[menu_name].items():
+                # Resolve the element class once per element type
+                element_class = self.ELEMENT_CLASSES.get(element_type)
                 for element_id, config in elements.items():
-                    if element_type == 'button':
-                        self.ui_elements[element_id] = UIButton(element_id, config, self.managers, self.logger)
-                    elif element_type == 'label':
-                        self.ui_elements[element_id] = UILabel(element_id, config, self.managers, self.logger)
+                    if element_class:
+                        self.ui_elements[element_id] = element_class(element_id, config, self.managers, self.logger)
                     else:
                         self.ui_elements[element_id] = UIElement(element_type, element_id, config, self.managers, self.logger)
         else:
@@ -109,26 +122,34 @@ class UIManager(BaseManager):
         - update
         - draw
     """
-    def update(self, mouse_pos, mouse_clicks):
+    def update(self, mouse_pos, mouse_clicks, mouse_pressed):
         """
         Update the UI state based on mouse interactions.
 
         Args:
             mouse_pos (tuple): Current position of the mouse.
             mouse_clicks (list): List of mouse click states.
+            mouse_pressed (tuple): Mouse buttons held down during the current frame.
         """
         # Iterate over each UI element and check for hover and click interactions
         for element in self.ui_elements.values():
-            element.update(mouse_pos, mouse_clicks)
+            element.update(mouse_pos, mouse_clicks, mouse_pressed)
 
     def draw(self):
         """
         Render the UI elements on the display surface.
         """
         if self.display:
+            # Skip UI elements lying entirely outside the display clip area
+            clip_rect = self.display.get_clip()
+            visible_elements = [element for element in self.ui_elements.values()
+                                if element.draw_rect is None or clip_rect.colliderect(element.draw_rect)]
+
             # Sort UI elements by their layer
-            sorted_elements = sorted(self.ui_elements.values(), key=lambda e: e.layer)
+            sorted_elements = sorted(visible_elements, key=lambda e: e.layer)
 
-            # Draw each UI element on the display surface
+            # Collect the layers of every UI element and draw them in a single batched blit
+            blit_sequence = []
             for element in sorted_elements:
-                element.draw(self.display)
+                blit_sequence.extend(element.get_blit_sequence())
+            self.display.blits(blit_sequence, doreturn=False)
@@ -19,6 +19,7 @@ class WindowManager(BaseManager):
         Game Attributes:
             - title (str): The title of the window.
             - game_size (tuple): The size of the game window in (width, height).
+            - displayed_fps (int): Frame rate currently shown in the window title.
 
         Display Attributes:
             - screen_info (pygame.display.Info): Information about the display.
@@ -27,6 +28,7 @@ class WindowManager(BaseManager):
             - display_factor (float): Factor for scaling based on display resolution.
             - display (pygame.Surface): Main display surface managed by the window manager.
             - surface (pygame.Surface): Surface for rendering game content.
+            - scaled_surface (pygame.Surface): Reusable surface holding the game content scaled to the display.
 
         Flags Attributes:
             - flags (int): Flags for display mode.
@@ -85,6 +87,7 @@ class WindowManager(BaseManager):
         # Game Attributes
         self.title = Optional[str]
         self.game_size = Optional[tuple]
+        self.displayed_fps = None
 
         # Display Attributes
         self.screen_info = pygame.display.Info()
@@ -93,6 +96,7 @@ class WindowManager(BaseManager):
         self.display_factor = 1
         self.display = pygame.display.set_mode((0, 0), HIDDEN)
         self.surface = pygame.Surface((0, 0))
+        self.scaled_surface = None
 
         # Flags Attributes
         self.is_fullscreen = Optional[bool]
@@ -126,6 +130,7 @@ class WindowManager(BaseManager):
         Set the title of the window.
         """
         self.title = self.config["title"]
+        self.displayed_fps = None
         pygame.display.set_caption(self.title)
 
     def set_size(self):
@@ -384,15 +389,26 @@ class WindowManager(BaseManager):
         Args:
             frame_rate (float): Current frame rate in frames per second.
         """
-        # Display the current FPS in the window title
-        pygame.display.set_caption(f"{self.title} ({int(frame_rate)} FPS)")
+        # Display the current FPS in the window title, only updating the caption when the value changes
+        fps = int(frame_rate)
+        if fps != self.displayed_fps:
+            self.displayed_fps = fps
+            pygame.display.set_caption(f"{self.title} ({fps} FPS)")
 
     def draw(self):
         """
         Render the game frame.
         """
-        # Scale and blit the game surface onto the display
-        scaled_surface = pygame.transform.scale(self.surface, self.screen_scaled)
+        if self.screen_scaled == self.game_size:
+            # No scaling needed, blit the game surface directly
+            scaled_surface = self.surface
+        else:
+            # Reuse the scaled surface between frames, reallocating it only when the scaled size changes
+            if self.scaled_surface is None or self.scaled_surface.get_size() != self.screen_scaled:
+                self.scaled_surface = pygame.Surface(self.screen_scaled)
+            scaled_surface = pygame.transform.scale(self.surface, self.screen_scaled, self.scaled_surface)
+
+        # Blit the game surface onto the display
         self.display.blit(scaled_surface, self.screen_gap)
 
         # Update the display
@@ -3,6 +3,7 @@ import random
 from pygame.locals import *
 from config import load_config
 from engine.ui_manager import UIManager
+from engine.ui_element import clear_caches
 from logger import Logger
 from engine.audio_manager import AudioManager
 from engine.window_manager import WindowManager
@@ -32,6 +33,7 @@ class MainManager:
         Input Handling Attributes:
             - mouse_pos (tuple): Current mouse position.
             - click (list): List to track mouse click states.
+            - mouse_pressed (tuple): Mouse buttons held down during the current frame.
 
         Manager Attributes:
             - window_manager (WindowManager): Instance of the WindowManager.
@@ -73,6 +75,7 @@ class MainManager:
         # Input Handling Attributes
         self.mouse_pos = (0, 0)
         self.click = [None, False, False, False, False, False]
+        self.mouse_pressed = (False, False, False)
 
         # Manager Attributes
         self.main_manager = self
@@ -209,6 +212,9 @@ class MainManager:
         # Update mouse position based on display_factor
         self.mouse_pos = self.window_manager.get_adjusted_mouse_position()
 
+        # Read the held mouse buttons once per frame for all UI elements
+        self.mouse_pressed = pygame.mouse.get_pressed()
+
     def update(self):
         """
         Update the game state.
@@ -216,17 +222,16 @@ class MainManager:
         # Update game components
         self.window_manager.update(self.clock.get_fps())
 
-        self.ui_manager.update(self.mouse_pos, self.click)
+        self.ui_manager.update(self.mouse_pos, self.click, self.mouse_pressed)
 
     def draw(self):
         """
         Render the game frame.
         """
         # Clear the display
-        self.display.fill((0, 0, 0))
+        self.display.fill((30, 30, 30))
 
         # Debug
-        self.display.fill((30, 30, 30))
         pygame.draw.circle(self.display, (255, 0, 0), (400, 300), 30)
 
         # Draw the game components
@@ -238,6 +243,9 @@ class MainManager:
         Quit the game and clean up resources.
         """
         self.logger.log_info(f"Total game time: {self.total_play_time:.3f} seconds")
+
+        # Release the cached UI resources before shutting down pygame
+        clear_caches()
         pygame.quit()
         quit()
 